@@ -16,6 +16,17 @@ class ChainedBenchmarkerProgress(
     def __init__(self, progresses: Sequence[BenchmarkerProgress]):
         super().__init__()
         self.progresses = progresses
+        # Bind each child's callbacks once instead of looking them up per event
+        self._methods = {
+            method: tuple(getattr(p, method) for p in progresses)
+            for method in (
+                "on_initialize",
+                "on_benchmark_start",
+                "on_benchmark_update",
+                "on_benchmark_complete",
+                "on_finalize",
+            )
+        }
 
     async def on_initialize(self, profile: Profile):
         await self._gather("on_initialize", profile)
@@ -37,4 +48,8 @@ class ChainedBenchmarkerProgress(
         await self._gather("on_finalize")
 
     async def _gather(self, method, *args):
-        await asyncio.gather(*(getattr(p, method)(*args) for p in self.progresses))
+        methods = self._methods[method]
+        if len(methods) == 1:
+            await methods[0](*args)
+        else:
+            await asyncio.gather(*(m(*args) for m in methods))
@@ -24,10 +24,13 @@ Usage:
     }
 """
 
+from typing import Any
+
 from guidellm.backends.response_handlers import (
     ChatCompletionsResponseHandler,
     GenerationResponseHandlerFactory,
 )
+from guidellm.utils import json
 
 
 @GenerationResponseHandlerFactory.register("chat_completions_with_reasoning")
@@ -51,6 +54,16 @@ class ChatCompletionsWithReasoningResponseHandler(ChatCompletionsResponseHandler
         response = handler.compile_streaming(request)
     """
 
+    def __init__(self):
+        """
+        Initialize the handler and bind the streaming text accumulator.
+
+        The bound ``append`` is cached so the per-token path in
+        add_streaming_line avoids an attribute lookup on every chunk.
+        """
+        super().__init__()
+        self._append_text = self.streaming_texts.append
+
     def __json__(self):
         """
         Return JSON-serializable representation of this handler class.
@@ -74,12 +87,36 @@ class ChatCompletionsWithReasoningResponseHandler(ChatCompletionsResponseHandler
         """
         return "chat_completions_with_reasoning"
 
+    def extract_line_data(self, line: str) -> dict[str, Any] | None:
+        """
+        Extract JSON data from a streaming response line.
+
+        Fast path for the canonical ``data: {...}`` SSE frame emitted by
+        OpenAI-compatible servers; anything else falls back to the base parser.
+
+        :param line: Raw line from the streaming response
+        :return: Parsed JSON data as dictionary, or None if line indicates completion
+        """
+        if line[:6] != "data: ":
+            return super().extract_line_data(line)
+
+        if (payload := line[6:]) == "[DONE]":
+            return None
+
+        return json.loads(payload)
+
     def add_streaming_line(self, line: str) -> int | None:
         """
         Process a single line from a chat completion streaming response.
 
         Handles both regular content and reasoning_content tokens to ensure
-        accurate timing metrics (TTFT and ITL).
+        accurate timing metrics (TTFT and ITL). Token arrival times are not
+        tracked here: the backend timestamps each line and derives TTFT/ITL
+        from the returned iteration count.
+
+        Lines arrive already split: guidellm's OpenAIHTTPBackend reads the
+        response with httpx ``aiter_lines()`` and passes each decoded line here,
+        so this handler does no line splitting of its own.
 
         :param line: Raw SSE line from the streaming response
         :return: 1 if any token was extracted, 0 if line ignored, None if done
@@ -87,17 +124,19 @@ class ChatCompletionsWithReasoningResponseHandler(ChatCompletionsResponseHandler
         if not (data := self.extract_line_data(line)):
             return None if data is None else 0
 
-        if "id" in data and self.streaming_response_id is None:
+        if self.streaming_response_id is None and "id" in data:
             self.streaming_response_id = data["id"]
 
         updated = False
-        choices, usage = self.extract_choices_and_usage(data)
-        choice: dict[str, dict] = choices[0] if choices else {}
 
         # Support both regular content and reasoning_content tokens
         # This ensures TTFT and ITL are calculated correctly for models with reasoning
-        if choices:
-            delta = choice.get("delta", {})
+        try:
+            delta = data["choices"][0]["delta"]
+        except (KeyError, IndexError, TypeError):
+            delta = None
+
+        if delta:
             content = delta.get("content")
             reasoning_content = delta.get("reasoning_content")
 
@@ -105,11 +144,13 @@ class ChatCompletionsWithReasoningResponseHandler(ChatCompletionsResponseHandler
             # IMPORTANT: Check if field exists (not if it's truthy) to handle empty strings
             # The first chunk often has content="" which should still count for TTFT
             if content is not None or reasoning_content is not None:
-                # Append whichever content is present (prioritize regular content)
-                self.streaming_texts.append(content or reasoning_content or "")
+                # Append whichever content is present (prioritize regular content);
+                # empty chunks still count as a token arrival but add no text
+                if text := content or reasoning_content:
+                    self._append_text(text)
                 updated = True
 
-        if usage:
+        if usage := data.get("usage"):
             self.streaming_usage = usage
 
         return 1 if updated else 0
@@ -18,14 +18,13 @@ Provides:
 from __future__ import annotations
 
 import asyncio
+import logging
 from pathlib import Path
 
 import click
 from pydantic import ValidationError
 from benchmark_runner.chained_progress import ChainedBenchmarkerProgress
 from guidellm.benchmark.entrypoints import benchmark_generative_text
-from benchmark_runner.progress import ServerBenchmarkerProgress
-from benchmark_runner.sharegpt_adapter import prepare_datasets
 from guidellm.backends.response_handlers import GenerationResponseHandlerFactory
 
 try:
@@ -46,6 +45,8 @@ from guidellm.settings import print_config
 from guidellm.utils import Console, DefaultGroupHandler, get_literal_vals
 from guidellm.utils import cli as cli_tools
 
+logger = logging.getLogger(__name__)
+
 STRATEGY_PROFILE_CHOICES: list[str] = list(get_literal_vals(ProfileType | StrategyType))
 """Available strategy and profile type choices for benchmark execution."""
 
@@ -391,6 +392,11 @@ def benchmark():
     help="Authentication token or credential for progress update requests.",
 )
 def run(**kwargs):  # noqa: C901
+    # Deferred so other commands don't load the progress reporter (aiohttp) or
+    # the ShareGPT adapter, which only `run` uses
+    from benchmark_runner.progress import ServerBenchmarkerProgress
+    from benchmark_runner.sharegpt_adapter import prepare_datasets
+
     # Only set CLI args that differ from click defaults
     kwargs = cli_tools.set_if_not_default(click.get_current_context(), **kwargs)
 
@@ -436,22 +442,15 @@ def run(**kwargs):  # noqa: C901
 
     progress_url = kwargs.pop("progress_url", None)
     progress_auth = kwargs.pop("progress_auth", None)
-    progress_chain = [
-        *(
-            [
-                ServerBenchmarkerProgress(
-                    progress_url=progress_url, progress_auth=progress_auth
-                )
-            ]
-            if progress_url
-            else []
-        ),
-        *(
-            [GenerativeConsoleBenchmarkerProgress()]
-            if not disable_console_interactive
-            else []
-        ),
-    ]
+    progress_chain = []
+    if progress_url:
+        progress_chain.append(
+            ServerBenchmarkerProgress(
+                progress_url=progress_url, progress_auth=progress_auth
+            )
+        )
+    if not disable_console_interactive:
+        progress_chain.append(GenerativeConsoleBenchmarkerProgress())
     progress = ChainedBenchmarkerProgress(progress_chain) if progress_chain else None
 
     try:
@@ -464,7 +463,7 @@ def run(**kwargs):  # noqa: C901
             tokenizer=args.processor,
             max_items=args.max_requests,
         )
-        print(f"[DEBUG] Prepared data sources: {args.data}")
+        logger.debug("Prepared data sources: %s", args.data)
     except ValidationError as err:
         # Translate pydantic valdation error to click argument error
         errs = err.errors(include_url=False, include_context=True, include_input=True)
@@ -10,11 +10,13 @@ Both files are saved to the same directory with clear naming conventions.
 
 from __future__ import annotations
 
+import asyncio
 import json
+from itertools import islice
 from pathlib import Path
 from typing import Any, ClassVar
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 
 from guidellm.benchmark.outputs.output import GenerativeBenchmarkerOutput
@@ -22,6 +24,81 @@ from guidellm.benchmark.schemas import GenerativeBenchmarksReport
 
 __all__ = ["GenerativeBenchmarkerDualJson", "AutoMarshalJSONEncoder"]
 
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _get_handler_class_to_name() -> dict[type, str]:
+    """
+    Build the mapping from registered response handler classes to their names.
+
+    Returns:
+        Dictionary mapping handler classes to their registered names.
+    """
+    from guidellm.backends.response_handlers import GenerationResponseHandlerFactory
+
+    registry = GenerationResponseHandlerFactory.registry or {}
+    return {v: k for k, v in registry.items()}
+
+
+def _marshal_class(cls: type) -> Any:
+    """
+    Compute the JSON representation of a class object.
+
+    Args:
+        cls: Class to serialize.
+
+    Returns:
+        The result of __class_json__() if defined, else the registered handler
+        name, else the fully qualified class name.
+    """
+    # Check if the class has a __class_json__ method
+    if hasattr(cls, "__class_json__"):
+        return cls.__class_json__()
+
+    # Try to find the registered name for this handler class
+    handler_name = _get_handler_class_to_name().get(cls)
+    if handler_name:
+        return handler_name
+
+    # Fallback: use the full class name
+    return f"{cls.__module__}.{cls.__name__}"
+
+
+# Marshaled name per class object; the same few handler classes recur throughout
+# a report, so each is resolved once. Clear this if the handler registry changes.
+_class_json_names: dict[type, Any] = {}
+
+
+def _auto_marshal(o: Any) -> Any:
+    """
+    Serialize objects that JSON encoders cannot handle natively.
+
+    Objects providing __class_json__() (for classes) or __json__() (for instances)
+    are marshaled through those methods, similar to Golang's MarshalJSON.
+    Used as the ``default`` hook of AutoMarshalJSONEncoder.
+
+    Args:
+        o: Object to serialize.
+
+    Returns:
+        Serializable representation of the object.
+
+    Raises:
+        TypeError: If the object is not serializable.
+    """
+    # Handle class/type objects (like response handler classes)
+    if isinstance(o, type):
+        if (class_name := _class_json_names.get(o)) is None:
+            class_name = _class_json_names[o] = _marshal_class(o)
+        return class_name
+
+    # Check if the object has a __json__ method (for instances)
+    json_method = getattr(o, "__json__", None)
+    if callable(json_method):
+        return json_method()
+
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
 
 class AutoMarshalJSONEncoder(json.JSONEncoder):
     """
@@ -42,33 +119,130 @@ class AutoMarshalJSONEncoder(json.JSONEncoder):
         Returns:
             Serializable representation of the object.
         """
-        # Check if the object has a __class_json__ method (for class objects)
-        if isinstance(o, type) and hasattr(o, "__class_json__"):
-            return o.__class_json__()
-
-        # Check if the object has a __json__ method (for instances)
-        if hasattr(o, "__json__") and callable(getattr(o, "__json__")):
-            return o.__json__()
-
-        # Handle class/type objects (like response handler classes)
-        if isinstance(o, type):
-            # Try to find the registered name for this handler class
-            from guidellm.backends.response_handlers import (
-                GenerationResponseHandlerFactory,
-            )
+        return _auto_marshal(o)
+
+
+_INDENT = 4
+_encoder = AutoMarshalJSONEncoder(indent=_INDENT)
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to indented JSON bytes.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        UTF-8 encoded JSON document.
+    """
+    return _encoder.encode(obj).encode("utf-8")
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    """
+    Serialize an object and stream it to the given path.
+
+    Top-level entries of a dict, and the items of top-level lists such as
+    ``benchmarks``, are encoded and written one at a time so only a single
+    entry's encoding is held in memory. The output is byte-identical to
+    serializing the whole object with _dumps.
+
+    Args:
+        path: Destination file path.
+        obj: Object to serialize.
+    """
+    if not isinstance(obj, dict) or not obj:
+        path.write_bytes(_dumps(obj))
+        return
+
+    key_break = b"\n" + b" " * _INDENT
+    item_break = key_break + b" " * _INDENT
+    with path.open("wb", buffering=_WRITE_BUFFER_SIZE) as file:
+        file.write(b"{")
+        for key_idx, (key, value) in enumerate(obj.items()):
+            file.write(b"," + key_break if key_idx else key_break)
+            file.write(_dumps(key) + b": ")
+
+            if not isinstance(value, list) or not value:
+                file.write(_indent(_dumps(value), 1))
+                continue
+
+            file.write(b"[")
+            for item_idx, item in enumerate(value):
+                file.write(b"," + item_break if item_idx else item_break)
+                file.write(_indent(_dumps(item), 2))
+            file.write(key_break + b"]")
+        file.write(b"\n}")
+
+
+def _indent(encoded: bytes, level: int) -> bytes:
+    """
+    Re-indent an encoded JSON fragment for nesting at the given depth.
 
-            registry = GenerationResponseHandlerFactory.registry or {}
-            class_to_name = {v: k for k, v in registry.items()}
+    Raw newlines only occur between tokens; newlines inside strings are escaped.
+    """
+    return encoded.replace(b"\n", b"\n" + b" " * (_INDENT * level))
 
-            handler_name = class_to_name.get(o)
-            if handler_name:
-                return handler_name
-            else:
-                # Fallback: use the full class name
-                return f"{o.__module__}.{o.__name__}"
 
-        # Let the base class handle other types or raise TypeError
-        return super().default(o)
+def _normalize_exclude(exclude: Any) -> dict[str, Any]:
+    """
+    Turn a set spec into a dict spec and reject shapes _exclude_fields can't apply.
+    """
+    if isinstance(exclude, (set, frozenset)):
+        exclude = dict.fromkeys(exclude, ...)
+    elif not isinstance(exclude, dict):
+        raise TypeError(f"Unsupported exclude spec: {exclude!r}")
+
+    if not all(isinstance(key, str) for key in exclude):
+        raise TypeError(f"Exclude spec keys must be field names: {exclude!r}")
+    return exclude
+
+
+def _exclude_fields(obj: Any, exclude: Any) -> Any:
+    """
+    Apply a pydantic-style ``exclude`` spec to an already dumped object.
+
+    Only containers on an excluded path are shallow-copied, key order is kept and
+    every other subtree is shared with the input, so deriving a summary from a
+    full dump avoids serializing the model a second time.
+
+    Args:
+        obj: Dumped object (dict, list or scalar).
+        exclude: Exclude spec; a set of field names, or a dict mapping field
+            names (or ``"__all__"`` for list items) to ``...``, ``True`` or a
+            nested spec.
+    Returns:
+        The object without the excluded fields.
+    Raises:
+        TypeError: If the spec uses a shape not supported here, such as list
+            index keys or ``"__all__"`` on a non-list value.
+    """
+    exclude = _normalize_exclude(exclude)
+
+    if isinstance(obj, list):
+        if exclude.keys() != {"__all__"}:
+            raise TypeError(f"List values only support an '__all__' spec: {exclude!r}")
+        item_exclude = exclude["__all__"]
+        if item_exclude is ... or item_exclude is True:
+            return []
+        return [_exclude_fields(item, item_exclude) for item in obj]
+
+    if not isinstance(obj, dict):
+        return obj
+
+    if "__all__" in exclude:
+        raise TypeError(f"'__all__' is only supported for list values: {exclude!r}")
+
+    pruned = dict(obj)
+    for key, sub_exclude in exclude.items():
+        if key not in pruned:
+            continue
+        if sub_exclude is ... or sub_exclude is True:
+            del pruned[key]
+        else:
+            pruned[key] = _exclude_fields(pruned[key], sub_exclude)
+    return pruned
 
 
 @GenerativeBenchmarkerOutput.register("dual_json")
@@ -118,6 +292,9 @@ class GenerativeBenchmarkerDualJson(GenerativeBenchmarkerOutput):
         description="Maximum number of incomplete requests to include.",
     )
 
+    # Summary and full file paths, resolved on the first finalize
+    _resolved_paths: tuple[Path, Path] | None = PrivateAttr(default=None)
+
     @classmethod
     def validated_kwargs(
         cls,
@@ -159,6 +336,34 @@ class GenerativeBenchmarkerDualJson(GenerativeBenchmarkerOutput):
         Returns:
             Path to the saved summary report file.
         """
+        summary_path, full_path = self._resolve_paths()
+
+        # Prepare data
+        full_dict = report.model_dump()
+        summary_dict = _exclude_fields(full_dict, self.EXCLUDE_FIELDS)
+        for benchmark, full_benchmark in zip(
+            summary_dict.get("benchmarks") or [], full_dict.get("benchmarks") or []
+        ):
+            requests = full_benchmark.get("requests") or {}
+            self._attach_error_samples(
+                benchmark,
+                errored=requests.get("errored") or [],
+                incomplete=requests.get("incomplete") or [],
+            )
+
+        # Serialize and write off the event loop so progress updates keep flowing;
+        # both dicts are only read from here on, so the writes can run concurrently
+        await asyncio.gather(
+            asyncio.to_thread(_write_json, summary_path, summary_dict),
+            asyncio.to_thread(_write_json, full_path, full_dict),
+        )
+
+        return summary_path
+
+    def _resolve_paths(self) -> tuple[Path, Path]:
+        if self._resolved_paths is not None:
+            return self._resolved_paths
+
         # Determine output paths
         summary_path = self.output_path
         if summary_path.is_dir():
@@ -172,50 +377,30 @@ class GenerativeBenchmarkerDualJson(GenerativeBenchmarkerOutput):
         # Ensure parent directory exists
         summary_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Prepare data
-        full_dict = report.model_dump()
-        summary_dict = report.model_dump(exclude=self.EXCLUDE_FIELDS)
-        self._attach_error_samples(summary_dict, full_dict)
-
-        # Use custom encoder to handle response handler classes
-        encoder_cls = AutoMarshalJSONEncoder
-
-        # Save summary JSON
-        summary_str = json.dumps(summary_dict, indent=4, cls=encoder_cls)
-        with summary_path.open("w", encoding="utf-8") as file:
-            file.write(summary_str)
-
-        # Save full JSON
-        full_str = json.dumps(full_dict, indent=4, cls=encoder_cls)
-        with full_path.open("w", encoding="utf-8") as file:
-            file.write(full_str)
-
-        return summary_path
+        self._resolved_paths = (summary_path, full_path)
+        return self._resolved_paths
 
     def _attach_error_samples(
-        self, summary_dict: dict[str, Any], full_dict: dict[str, Any]
+        self,
+        benchmark: dict[str, Any],
+        errored: list[Any],
+        incomplete: list[Any],
     ) -> None:
-        summary_benchmarks = summary_dict.get("benchmarks") or []
-        full_benchmarks = full_dict.get("benchmarks") or []
-
-        for idx, benchmark in enumerate(summary_benchmarks):
-            full_benchmark = full_benchmarks[idx] if idx < len(full_benchmarks) else {}
-            requests = (full_benchmark or {}).get("requests") or {}
-
-            errored = self._limit_items(requests.get("errored") or [], self.error_limit)
-            incomplete = self._limit_items(
-                requests.get("incomplete") or [], self.incomplete_limit
-            )
+        errored = self._limit_items(errored, self.error_limit)
+        incomplete = self._limit_items(incomplete, self.incomplete_limit)
 
-            if errored or incomplete:
-                benchmark["requests_truncated"] = {}
-                if errored:
-                    benchmark["requests_truncated"]["errored"] = errored
-                if incomplete:
-                    benchmark["requests_truncated"]["incomplete"] = incomplete
+        if errored or incomplete:
+            benchmark["requests_truncated"] = {}
+            if errored:
+                benchmark["requests_truncated"]["errored"] = errored
+            if incomplete:
+                benchmark["requests_truncated"]["incomplete"] = incomplete
 
     @staticmethod
     def _limit_items(items: list[Any], limit: int | None) -> list[Any]:
         if limit is None:
-            return list(items)
-        return list(items)[: max(limit, 0)]
+            # The full report lists are only read afterwards, so they can be shared
+            return items if isinstance(items, list) else list(items)
+        if limit <= 0:
+            return []
+        return list(islice(items, limit))
@@ -1,3 +1,6 @@
+import asyncio
+import json
+import logging
 import time
 import aiohttp
 from guidellm.benchmark.progress import (
@@ -9,6 +12,8 @@ from guidellm.benchmark.progress import (
     SchedulingStrategy,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ServerBenchmarkerProgress(
     BenchmarkerProgress[GenerativeBenchmarkAccumulator, GenerativeBenchmark]
@@ -17,9 +22,13 @@ class ServerBenchmarkerProgress(
         super().__init__()
         self.progress_url = progress_url
         self.progress_auth = progress_auth
+        # Authorization comes from the session headers
+        self._headers_json = {"Content-Type": "application/json"}
         self.session = None
         self._last_update_ts = 0
         self._last_progress = -1.0
+        self._queue: asyncio.Queue | None = None
+        self._sender: asyncio.Task | None = None
 
     async def on_initialize(self, profile: Profile):
         if self.session is None:
@@ -29,6 +38,11 @@ class ServerBenchmarkerProgress(
             self.session = aiohttp.ClientSession(
                 headers=headers, timeout=aiohttp.ClientTimeout(total=60)
             )
+        if self._sender is None:
+            # Progress is sent from a background task so a slow progress endpoint
+            # never stalls the benchmark's update callbacks
+            self._queue = asyncio.Queue()
+            self._sender = asyncio.create_task(self._sender_loop())
 
     async def on_benchmark_start(self, strategy: SchedulingStrategy):
         await self._update_progress(0)
@@ -49,10 +63,16 @@ class ServerBenchmarkerProgress(
         await self._update_progress(100)
 
     async def on_finalize(self):
+        if self._sender is not None:
+            # None is the sentinel telling the sender to flush and stop
+            self._queue.put_nowait(None)
+            await self._sender
+            self._sender = None
+            self._queue = None
         await self.session.close()
 
     async def _update_progress(self, progress: float):
-        if self.session is None:
+        if self._queue is None:
             return
 
         now = time.time()
@@ -64,14 +84,34 @@ class ServerBenchmarkerProgress(
         if not should_update:
             return
 
-        try:
-            resp = await self.session.patch(
-                f"{self.progress_url}", json={"progress": progress}
-            )
-            resp.raise_for_status()
+        self._last_progress = progress
+        self._last_update_ts = now
+        self._queue.put_nowait(progress)
 
-            self._last_progress = progress
-            self._last_update_ts = now
+    async def _sender_loop(self):
+        while True:
+            progress = await self._queue.get()
+            stopping = progress is None
 
+            # Coalesce updates queued during the previous send into the latest one
+            while not self._queue.empty():
+                pending = self._queue.get_nowait()
+                if pending is None:
+                    stopping = True
+                else:
+                    progress = pending
+
+            if progress is not None:
+                await self._send_progress(progress)
+            if stopping:
+                return
+
+    async def _send_progress(self, progress: float):
+        body = json.dumps({"progress": progress}).encode("utf-8")
+        try:
+            async with self.session.patch(
+                self.progress_url, data=body, headers=self._headers_json
+            ) as resp:
+                resp.raise_for_status()
         except Exception as e:
-            raise RuntimeError(f"Failed to update progress to server: {e}")
+            logger.warning("Failed to update progress to server: %s", e)
@@ -1,12 +1,17 @@
+import os
 from pathlib import Path
 from benchmark_runner.sharegpt_to_guidellm import convert_sharegpt_to_guidellm
 
+# Prepared outputs per (absolute source, tokenizer, max_items), so repeated
+# prepare_datasets calls in one process skip the filesystem check. Entries are
+# never rechecked: a converted file deleted mid-process is not regenerated.
+_prepare_cache: dict[tuple[str, str, int | None], list[str]] = {}
+
 
 class ShareGPTAdapter:
     def supports(self, source: str) -> bool:
-        return (
-            source.endswith(".json") or source.endswith(".jsonl")
-        ) and "sharegpt" in source.lower()
+        source = source.lower()
+        return source.endswith((".json", ".jsonl")) and "sharegpt" in source
 
     def prepare(
         self,
@@ -15,10 +20,16 @@ class ShareGPTAdapter:
         tokenizer: str,
         max_items: int | None,
     ) -> list[str]:
+        key = (os.path.abspath(source), tokenizer, max_items)
+        if (cached := _prepare_cache.get(key)) is not None:
+            return list(cached)
+
         source_path = Path(source)
+
         output = source_path.parent / f"converted_{source_path.stem}.jsonl"
 
         if output.exists():
+            _prepare_cache[key] = [str(output)]
             return [str(output)]
 
         if max_items is not None:
@@ -30,6 +41,7 @@ class ShareGPTAdapter:
             tokenizer_name=tokenizer,
             max_items=max_items,
         )
+        _prepare_cache[key] = [str(output)]
         return [str(output)]
 
 
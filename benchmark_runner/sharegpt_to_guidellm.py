@@ -5,8 +5,9 @@ import argparse
 import json
 import logging
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
+import ijson
 from transformers import AutoTokenizer, PreTrainedTokenizerBase
 
 logger = logging.getLogger("sharegpt_to_guidellm")
@@ -19,6 +20,18 @@ if not logger.hasHandlers():
     logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 
+# Completions are tokenized in batches to stay in the fast tokenizer's Rust path
+TOKENIZE_BATCH_SIZE = 4096
+WRITE_CHUNK_SIZE = 1 << 20
+
+# Repeated completions (refusals, short acks) reuse their token count; the cache
+# is bounded in entries and key length so memory stays small on large dumps
+TOKEN_COUNT_CACHE_SIZE = 100_000
+TOKEN_COUNT_CACHE_MAX_CHARS = 1024
+
+_HUMAN = frozenset(("human", "user"))
+_ASSISTANT = frozenset(("gpt", "assistant"))
+
 
 # -------------------------
 # Tokenizer
@@ -34,16 +47,23 @@ def load_tokenizer(tokenizer_name: str) -> PreTrainedTokenizerBase:
     return tokenizer
 
 
-def count_tokens(
+def count_tokens_batch(
     tokenizer: PreTrainedTokenizerBase,
-    text: str,
-) -> int:
-    return len(
-        tokenizer(
-            text,
-            add_special_tokens=False,
-        )["input_ids"]
+    texts: list[str],
+) -> list[int]:
+    # Call the Rust encode_batch directly unless truncation/padding would change counts
+    backend = getattr(tokenizer, "backend_tokenizer", None)
+    if backend is not None and backend.truncation is None and backend.padding is None:
+        encodings = backend.encode_batch(texts, add_special_tokens=False)
+        return [len(encoding.ids) for encoding in encodings]
+
+    encoded = tokenizer(
+        texts,
+        add_special_tokens=False,
+        return_attention_mask=False,
+        return_token_type_ids=False,
     )
+    return [len(ids) for ids in encoded["input_ids"]]
 
 
 # -------------------------
@@ -54,11 +74,18 @@ def count_tokens(
 def iter_sharegpt_samples(
     input_file: Path,
 ) -> Iterable[dict]:
-    with input_file.open("r", encoding="utf-8") as f:
-        dataset = json.load(f)
+    with input_file.open("rb") as f:
+        is_array = f.read(4096).lstrip()[:1] == b"["
+        f.seek(0)
 
-    for sample in dataset:
-        yield sample
+        if not is_array:
+            # JSON Lines: one sample per line
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            # Stream the top-level array instead of loading the whole dataset
+            yield from ijson.items(f, "item", use_float=True)
 
 
 def extract_first_turn(sample: dict) -> Optional[tuple[str, str]]:
@@ -68,9 +95,13 @@ def extract_first_turn(sample: dict) -> Optional[tuple[str, str]]:
 
     first, second = conversations[0], conversations[1]
 
-    if first.get("from") not in ("human", "user"):
+    # Roles are type-checked first: frozenset lookups hash, and malformed dumps
+    # may hold unhashable values here
+    first_role = first.get("from")
+    if not isinstance(first_role, str) or first_role not in _HUMAN:
         return None
-    if second.get("from") not in ("gpt", "assistant"):
+    second_role = second.get("from")
+    if not isinstance(second_role, str) or second_role not in _ASSISTANT:
         return None
 
     prompt = first.get("value")
@@ -89,26 +120,80 @@ def extract_first_turn(sample: dict) -> Optional[tuple[str, str]]:
 
 def build_guidellm_record(
     prompt: str,
-    completion: str,
-    tokenizer: PreTrainedTokenizerBase,
+    output_tokens: int,
 ) -> dict:
-    output_tokens = count_tokens(tokenizer, completion)
-
     return {
         "text": prompt,
         "output_tokens_count": output_tokens,
     }
 
 
+def build_guidellm_records(
+    turns: list[tuple[str, str]],
+    tokenizer: PreTrainedTokenizerBase,
+    token_count_cache: dict[str, int],
+) -> list[dict]:
+    # Only completions not seen before are tokenized, each of them once
+    misses = [
+        completion
+        for completion in dict.fromkeys(completion for _, completion in turns)
+        if completion not in token_count_cache
+    ]
+    token_counts = (
+        dict(zip(misses, count_tokens_batch(tokenizer, misses))) if misses else {}
+    )
+
+    for completion, output_tokens in token_counts.items():
+        if len(token_count_cache) >= TOKEN_COUNT_CACHE_SIZE:
+            break
+        if len(completion) <= TOKEN_COUNT_CACHE_MAX_CHARS:
+            token_count_cache[completion] = output_tokens
+
+    return [
+        build_guidellm_record(
+            prompt,
+            (
+                token_counts[completion]
+                if completion in token_counts
+                else token_count_cache[completion]
+            ),
+        )
+        for prompt, completion in turns
+    ]
+
+
 # -------------------------
 # Writer
 # -------------------------
 
 
+def dumps_record(record: dict) -> bytes:
+    return json.dumps(record, ensure_ascii=False).encode("utf-8")
+
+
 def write_jsonl(path: Path, records: Iterable[dict]) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        for record in records:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    # Records are streamed, so write to a sibling and rename once complete to
+    # never leave a partial file behind for ShareGPTAdapter to reuse
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            # Encoded lines are joined into ~WRITE_CHUNK_SIZE chunks, one write each
+            chunk: list[bytes] = []
+            size = 0
+            for record in records:
+                line = dumps_record(record)
+                chunk.append(line)
+                size += len(line) + 1
+                if size >= WRITE_CHUNK_SIZE:
+                    f.write(b"\n".join(chunk) + b"\n")
+                    chunk.clear()
+                    size = 0
+            if chunk:
+                f.write(b"\n".join(chunk) + b"\n")
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    tmp_path.replace(path)
 
 
 def write_json(path: Path, records: list[dict]) -> None:
@@ -121,6 +206,70 @@ def write_json(path: Path, records: list[dict]) -> None:
 # -------------------------
 
 
+class ConversionStats:
+    """
+    Running counts of a ShareGPT conversion.
+    Updated as samples are read and records are yielded, so the counts stay
+    accurate even if the consumer stops early.
+    """
+
+    def __init__(self) -> None:
+        self.written = 0
+        self.skipped = 0
+
+
+def iter_guidellm_records(
+    input_file: Path,
+    tokenizer: PreTrainedTokenizerBase,
+    max_items: Optional[int],
+    stats: ConversionStats,
+) -> Iterator[dict]:
+    """
+    Yield guidellm records converted from a ShareGPT dataset, batch by batch.
+    stats.written counts the records yielded so far, stats.skipped the samples
+    without a usable first turn.
+    """
+    pending: list[tuple[str, str]] = []
+    token_count_cache: dict[str, int] = {}
+    accepted = 0
+    # Progress logging: log every 10000 processed samples, counted down
+    log_in = 10000
+
+    idx = 0
+    for sample in iter_sharegpt_samples(input_file):
+        idx += 1
+        result = extract_first_turn(sample)
+        if not result:
+            stats.skipped += 1
+        else:
+            pending.append(result)
+            accepted += 1
+            if len(pending) >= TOKENIZE_BATCH_SIZE:
+                for record in build_guidellm_records(
+                    pending, tokenizer, token_count_cache
+                ):
+                    stats.written += 1
+                    yield record
+                pending.clear()
+            if max_items is not None and accepted == max_items:
+                break
+        log_in -= 1
+        if not log_in:
+            logger.info(
+                f"Progress: processed={idx}, written={accepted}, "
+                f"skipped={stats.skipped}"
+            )
+            log_in = 10000
+    for record in build_guidellm_records(pending, tokenizer, token_count_cache):
+        stats.written += 1
+        yield record
+    # Final progress log
+    logger.info(
+        f"Progress: processed={idx}, written={stats.written}, "
+        f"skipped={stats.skipped} (final)"
+    )
+
+
 def convert_sharegpt_to_guidellm(
     input_file: Path,
     output_file: Path,
@@ -136,42 +285,15 @@ def convert_sharegpt_to_guidellm(
     logger.info(f"Loading tokenizer: {tokenizer_name}")
 
     tokenizer = load_tokenizer(tokenizer_name)
-    records = []
-    written = 0
-    skipped = 0
-    # Progress logging: log every 10000 processed samples
+    stats = ConversionStats()
 
     logger.info(f"Starting conversion from {input_file} to {output_file}")
-    idx = 0
-    for sample in iter_sharegpt_samples(input_file):
-        idx += 1
-        result = extract_first_turn(sample)
-        if not result:
-            skipped += 1
-            if idx % 10000 == 0:
-                logger.info(
-                    f"Progress: processed={idx}, written={written}, skipped={skipped}"
-                )
-            continue
-        prompt, completion = result
-        record = build_guidellm_record(prompt, completion, tokenizer)
-        records.append(record)
-        written += 1
-        if max_items is not None and written == max_items:
-            break
-        if idx % 10000 == 0:
-            logger.info(
-                f"Progress: processed={idx}, written={written}, skipped={skipped}"
-            )
-    # Final progress log
-    logger.info(
-        f"Progress: processed={idx}, written={written}, skipped={skipped} (final)"
-    )
+    records = iter_guidellm_records(input_file, tokenizer, max_items, stats)
     if output_format == "jsonl":
         write_jsonl(output_file, records)
     else:
-        write_json(output_file, records)
-    return {"written": written, "skipped": skipped, "output": output_file}
+        write_json(output_file, list(records))
+    return {"written": stats.written, "skipped": stats.skipped, "output": output_file}
 
 
 def main() -> None: